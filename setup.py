@@ -34,6 +34,7 @@ setup(
         "fastapi>=0.104.1",
         "uvicorn>=0.24.0",
         "python-multipart>=0.0.6",
+        "orjson>=3.9.10",
         "click>=8.1.7",
         "rich>=13.7.0",
         "colorlog>=6.8.0",
@@ -1,22 +1,34 @@
 """FastAPI backend for serving ontology data."""
 
 import os
-import json
-from typing import Optional
+from bisect import bisect_left
+from email.utils import formatdate
+from functools import lru_cache
+from itertools import chain, islice
+from typing import (
+    TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar,
+    get_args, get_origin
+)
 from pathlib import Path
-from fastapi import FastAPI, HTTPException
+
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from pydantic import BaseModel
 
-from .models import OntologyModel
 from .config import get_app_config
 
+if TYPE_CHECKING:
+    from .models import OntologyModel
+
 
 app = FastAPI(
     title="Database Ontology Mapper API",
     description="API for database schema visualization",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -28,31 +40,176 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global state
-_ontology: Optional[OntologyModel] = None
+# Global state: (mtime_ns, ontology) of the last loaded ontology file
+_ontology: Optional[Tuple[int, "OntologyModel"]] = None
+_search_index: Dict[str, List[tuple]] = {}
+_search_keys: Dict[str, List[str]] = {}
+_stats: Dict[str, Any] = {}
+_ontology_bytes: bytes = b""
+_cache_headers: Dict[str, str] = {}
+_databases_summary: List[Dict[str, Any]] = []
+_relationships_dump: List[Dict[str, Any]] = []
+_dump_cache: Dict[tuple, bytes] = {}
 _config = get_app_config()
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _nested_model_fields(model_cls: Type[BaseModel]) -> Dict[str, Tuple[Type[BaseModel], bool]]:
+    """
+    Map each field holding nested models to (model class, is list).
+    
+    Field annotations are inspected once per model class rather than once
+    per constructed instance.
+    """
+    nested = {}
+    for field_name, field in model_cls.model_fields.items():
+        annotation = field.annotation
+        
+        if get_origin(annotation) is list:
+            item_cls = get_args(annotation)[0]
+            if isinstance(item_cls, type) and issubclass(item_cls, BaseModel):
+                nested[field_name] = (item_cls, True)
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            nested[field_name] = (annotation, False)
+    
+    return nested
+
+
+def _construct(model_cls: Type[ModelT], data: dict) -> ModelT:
+    """
+    Recursively build a model without running validation.
+    
+    The ontology file is written by the extractor from already validated
+    models, so re-validating every column on load is wasted work.
+    """
+    values = dict(data)
+    for field_name, (item_cls, is_list) in _nested_model_fields(model_cls).items():
+        value = values.get(field_name)
+        if value is None:
+            continue
+        if is_list:
+            values[field_name] = [_construct(item_cls, item) for item in value]
+        else:
+            values[field_name] = _construct(item_cls, value)
+    
+    return model_cls.model_construct(**values)
+
+
+def _build_search_index(ontology: "OntologyModel") -> Dict[str, List[tuple]]:
+    """
+    Flatten the ontology into tuples keyed by pre-lowercased names.
+    
+    Each list is sorted by its lowercased name so prefix matches can be
+    located by binary search.
+    """
+    index: Dict[str, List[tuple]] = {
+        "databases": [],
+        "tables": [],
+        "columns": []
+    }
+    
+    for db in ontology.databases:
+        index["databases"].append((db.name.lower(), db.name, db.host))
+        
+        for table in db.tables:
+            index["tables"].append(
+                (table.name.lower(), db.name, table.name, table.table_type)
+            )
+            
+            for column in table.columns:
+                index["columns"].append(
+                    (column.name.lower(), db.name, table.name, column.name, column.data_type)
+                )
+    
+    for entries in index.values():
+        entries.sort(key=lambda entry: entry[0])
+    
+    return index
+
 
-def load_ontology() -> OntologyModel:
-    """Load ontology from output file."""
-    global _ontology
+def _iter_matches(kind: str, query: str) -> Iterator[tuple]:
+    """Yield index entries whose name contains query, prefix matches first."""
+    keys = _search_keys[kind]
+    entries = _search_index[kind]
+    
+    start = end = bisect_left(keys, query)
+    while end < len(keys) and keys[end].startswith(query):
+        yield entries[end]
+        end += 1
+    
+    for i in chain(range(start), range(end, len(keys))):
+        if query in keys[i]:
+            yield entries[i]
+
+
+def _compute_stats(ontology: "OntologyModel") -> Dict[str, Any]:
+    """Count databases, tables, columns and relationships once per load."""
+    return {
+        "database_count": len(ontology.databases),
+        "table_count": ontology.total_tables,
+        "column_count": ontology.total_columns,
+        "relationship_count": len(ontology.relationships)
+    }
+
+
+def load_ontology() -> "OntologyModel":
+    """
+    Load ontology from output file.
+    
+    The parsed ontology is cached and reused until the file's modification
+    time changes, so a fresh extraction is picked up without a restart.
+    """
+    global _ontology, _search_index, _search_keys, _stats, _ontology_bytes, _dump_cache
+    global _databases_summary, _relationships_dump, _cache_headers
     
-    if _ontology:
-        return _ontology
+    # Deferred so importing the app does not pay for the model definitions
+    from .models import OntologyModel
     
     output_file = Path(_config.output_dir) / "ontology.json"
     
-    if not output_file.exists():
+    try:
+        stat = output_file.stat()
+    except FileNotFoundError:
         raise HTTPException(
             status_code=404,
             detail="Ontology not found. Please run extraction first."
         )
     
+    mtime = stat.st_mtime_ns
+    if _ontology and _ontology[0] == mtime:
+        return _ontology[1]
+    
     try:
-        with open(output_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            _ontology = OntologyModel(**data)
-            return _ontology
+        data = orjson.loads(output_file.read_bytes())
+        ontology = _construct(OntologyModel, data)
+        _search_index = _build_search_index(ontology)
+        _search_keys = {
+            kind: [entry[0] for entry in entries]
+            for kind, entries in _search_index.items()
+        }
+        _stats = _compute_stats(ontology)
+        _ontology_bytes = ontology.to_json_bytes()
+        _dump_cache = {}
+        _databases_summary = [
+            {
+                "name": db.name,
+                "host": db.host,
+                "port": db.port,
+                "table_count": db.table_count,
+                "character_set": db.character_set,
+                "collation": db.collation
+            }
+            for db in ontology.databases
+        ]
+        _relationships_dump = [rel.model_dump() for rel in ontology.relationships]
+        _cache_headers = {
+            "ETag": f'W/"{mtime}-{stat.st_size}"',
+            "Last-Modified": formatdate(stat.st_mtime, usegmt=True)
+        }
+        _ontology = (mtime, ontology)
+        return ontology
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -61,33 +218,60 @@ def load_ontology() -> OntologyModel:
 
 
 
+def _not_modified(request: Request) -> Optional[Response]:
+    """
+    Return a 304 response if the client already has the current ontology.
+    
+    Every payload is derived from the ontology file, so a single ETag per
+    loaded file covers all endpoints.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    
+    etags = {tag.strip() for tag in if_none_match.split(",")}
+    if "*" in etags or _cache_headers["ETag"] in etags:
+        return Response(status_code=304, headers=_cache_headers)
+    return None
+
+
+def _cached_json(request: Request, key: tuple, model: BaseModel) -> Response:
+    """
+    Serve a model as JSON, encoding it only once per ontology load.
+    
+    None-valued fields are omitted to keep per-entity payloads small.
+    """
+    not_modified = _not_modified(request)
+    if not_modified:
+        return not_modified
+    
+    body = _dump_cache.get(key)
+    if body is None:
+        body = model.model_dump_json(exclude_none=True).encode()
+        _dump_cache[key] = body
+    return Response(body, media_type="application/json", headers=_cache_headers)
+
 
 @app.get("/api/ontology")
-async def get_ontology():
+async def get_ontology(request: Request):
     """Get complete ontology data."""
-    ontology = load_ontology()
-    return ontology.to_dict()
+    load_ontology()
+    return _not_modified(request) or Response(
+        _ontology_bytes, media_type="application/json", headers=_cache_headers
+    )
 
 
 @app.get("/api/databases")
-async def get_databases():
+async def get_databases(request: Request):
     """Get list of databases."""
-    ontology = load_ontology()
-    return [
-        {
-            "name": db.name,
-            "host": db.host,
-            "port": db.port,
-            "table_count": len(db.tables),
-            "character_set": db.character_set,
-            "collation": db.collation
-        }
-        for db in ontology.databases
-    ]
+    load_ontology()
+    return _not_modified(request) or ORJSONResponse(
+        _databases_summary, headers=_cache_headers
+    )
 
 
 @app.get("/api/databases/{database_name}")
-async def get_database(database_name: str):
+async def get_database(request: Request, database_name: str):
     """Get specific database details."""
     ontology = load_ontology()
     database = ontology.get_database(database_name)
@@ -95,11 +279,11 @@ async def get_database(database_name: str):
     if not database:
         raise HTTPException(status_code=404, detail="Database not found")
     
-    return database.model_dump()
+    return _cached_json(request, ("database", database_name), database)
 
 
 @app.get("/api/databases/{database_name}/tables/{table_name}")
-async def get_table(database_name: str, table_name: str):
+async def get_table(request: Request, database_name: str, table_name: str):
     """Get specific table details."""
     ontology = load_ontology()
     table = ontology.get_table(database_name, table_name)
@@ -107,76 +291,59 @@ async def get_table(database_name: str, table_name: str):
     if not table:
         raise HTTPException(status_code=404, detail="Table not found")
     
-    return table.model_dump()
+    return _cached_json(request, ("table", database_name, table_name), table)
 
 
 @app.get("/api/relationships")
-async def get_relationships():
+async def get_relationships(request: Request):
     """Get all relationships."""
-    ontology = load_ontology()
-    return [rel.model_dump() for rel in ontology.relationships]
+    load_ontology()
+    return _not_modified(request) or ORJSONResponse(
+        _relationships_dump, headers=_cache_headers
+    )
 
 
 @app.get("/api/search")
-async def search(q: str):
-    """Search for tables, columns, or databases by name."""
-    ontology = load_ontology()
-    results = {
-        "databases": [],
-        "tables": [],
-        "columns": []
-    }
+async def search(q: str, limit: int = Query(50, ge=1)):
+    """
+    Search for tables, columns, or databases by name.
     
+    Returns at most `limit` results per kind, names starting with the query
+    first.
+    """
+    load_ontology()
     query = q.lower()
     
-    for db in ontology.databases:
-        # Search databases
-        if query in db.name.lower():
-            results["databases"].append({
-                "database": db.name,
-                "host": db.host
-            })
-        
-        # Search tables and columns
-        for table in db.tables:
-            if query in table.name.lower():
-                results["tables"].append({
-                    "database": db.name,
-                    "table": table.name,
-                    "type": table.table_type
-                })
-            
-            for column in table.columns:
-                if query in column.name.lower():
-                    results["columns"].append({
-                        "database": db.name,
-                        "table": table.name,
-                        "column": column.name,
-                        "type": column.data_type
-                    })
-    
-    return results
+    return {
+        "databases": [
+            {"database": db_name, "host": host}
+            for _, db_name, host in islice(_iter_matches("databases", query), limit)
+        ],
+        "tables": [
+            {"database": db_name, "table": table_name, "type": table_type}
+            for _, db_name, table_name, table_type in islice(
+                _iter_matches("tables", query), limit
+            )
+        ],
+        "columns": [
+            {
+                "database": db_name,
+                "table": table_name,
+                "column": column_name,
+                "type": data_type
+            }
+            for _, db_name, table_name, column_name, data_type in islice(
+                _iter_matches("columns", query), limit
+            )
+        ]
+    }
 
 
 @app.get("/api/stats")
 async def get_stats():
     """Get ontology statistics."""
     ontology = load_ontology()
-    
-    total_tables = sum(len(db.tables) for db in ontology.databases)
-    total_columns = sum(
-        len(table.columns) 
-        for db in ontology.databases 
-        for table in db.tables
-    )
-    
-    return {
-        "database_count": len(ontology.databases),
-        "table_count": total_tables,
-        "column_count": total_columns,
-        "relationship_count": len(ontology.relationships),
-        "metadata": ontology.metadata
-    }
+    return {**_stats, "metadata": ontology.metadata}
 
 
 # Serve frontend static files
@@ -2,13 +2,18 @@
 
 import os
 import re
-from typing import List, Dict
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Dict, Optional
 from urllib.parse import quote_plus
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
 
+_DB_ENV_RE = re.compile(r'^DB_(\d+)_(.+)$')
+
+
 class DatabaseConfig(BaseModel):
     """Configuration for a single database connection."""
     
@@ -19,11 +24,17 @@ class DatabaseConfig(BaseModel):
     user: str
     password: str
     
-    def get_connection_string(self) -> str:
-        """Get SQLAlchemy connection string with URL-encoded credentials."""
+    def get_connection_string(self, database: Optional[str] = None) -> str:
+        """
+        Get SQLAlchemy connection string with URL-encoded credentials.
+        
+        Args:
+            database: Database to connect to instead of the configured one
+        """
         encoded_user = quote_plus(self.user)
         encoded_password = quote_plus(self.password)
-        return f"mysql+pymysql://{encoded_user}:{encoded_password}@{self.host}:{self.port}/{self.name}"
+        name = database or self.name
+        return f"mysql+pymysql://{encoded_user}:{encoded_password}@{self.host}:{self.port}/{name}"
     
     def get_display_name(self) -> str:
         """Get display name for this database."""
@@ -43,6 +54,7 @@ class AppConfig(BaseSettings):
         extra = "ignore"  # Ignore extra fields like DB_* variables
 
 
+@lru_cache(maxsize=1)
 def load_database_configs() -> List[DatabaseConfig]:
     """
     Load database configurations from environment variables.
@@ -50,24 +62,24 @@ def load_database_configs() -> List[DatabaseConfig]:
     Looks for variables in the format:
     DB_{N}_HOST, DB_{N}_PORT, DB_{N}_NAME, DB_{N}_USER, DB_{N}_PASSWORD
     
+    The result is cached for the life of the process; treat it as read-only.
+    
     Returns:
         List of DatabaseConfig objects
     """
     load_dotenv()
     
-    configs: Dict[int, Dict[str, str]] = {}
-    pattern = re.compile(r'^DB_(\d+)_(.+)$')
+    configs: Dict[int, Dict[str, str]] = defaultdict(dict)
     
     # Parse environment variables
     for key, value in os.environ.items():
-        match = pattern.match(key)
+        if not key.startswith("DB_"):
+            continue
+        
+        match = _DB_ENV_RE.match(key)
         if match:
             db_id = int(match.group(1))
             field_name = match.group(2).lower()
-            
-            if db_id not in configs:
-                configs[db_id] = {}
-            
             configs[db_id][field_name] = value
     
     # Convert to DatabaseConfig objects
@@ -99,8 +111,9 @@ def load_database_configs() -> List[DatabaseConfig]:
     return database_configs
 
 
+@lru_cache(maxsize=1)
 def get_app_config() -> AppConfig:
-    """Get application configuration."""
+    """Get application configuration (cached for the life of the process)."""
     load_dotenv()
     return AppConfig()
 
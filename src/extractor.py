@@ -1,16 +1,78 @@
 """Database schema extraction using INFORMATION_SCHEMA queries."""
 
+import sys
 import pymysql
-from typing import List, Optional
+from collections import defaultdict
+from itertools import groupby
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypedDict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError
+from pydantic import TypeAdapter
 
 from .config import DatabaseConfig
-from .models import (
-    DatabaseModel, TableModel, ColumnModel, 
-    IndexModel, ForeignKeyModel, OntologyModel, RelationshipModel
-)
+from .models import DatabaseModel, TableModel, OntologyModel, RelationshipModel
+
+
+class ColumnDict(TypedDict):
+    """Column as extracted, before validation into ColumnModel."""
+    
+    name: str
+    data_type: str
+    is_nullable: bool
+    default_value: Optional[str]
+    character_maximum_length: Optional[int]
+    numeric_precision: Optional[int]
+    numeric_scale: Optional[int]
+    column_key: Optional[str]
+    extra: Optional[str]
+    column_comment: Optional[str]
+
+
+class IndexDict(TypedDict):
+    """Index as extracted, before validation into IndexModel."""
+    
+    name: str
+    column_names: List[str]
+    is_unique: bool
+    index_type: str
+
+
+class ForeignKeyDict(TypedDict):
+    """Foreign key as extracted, before validation into ForeignKeyModel."""
+    
+    constraint_name: str
+    column_name: str
+    referenced_table_schema: str
+    referenced_table_name: str
+    referenced_column_name: str
+    update_rule: Optional[str]
+    delete_rule: Optional[str]
+
+
+# Validates a database's tables, including their columns, indexes and
+# foreign keys, in a single call once they are assembled
+_TABLES_ADAPTER = TypeAdapter(List[TableModel])
+
+# Rows fetched per round trip when streaming INFORMATION_SCHEMA scans
+STREAM_CHUNK_SIZE = 1000
+
+# Databases extracted at once. Each one runs its four schema-wide metadata
+# queries concurrently, so a run holds at most 4 * DATABASE_WORKERS
+# connections to the servers.
+DATABASE_WORKERS = 8
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    Intern low-cardinality strings such as data types and engine names.
+    
+    These repeat across thousands of columns and tables, so every model
+    shares one string object per distinct value.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 class SchemaExtractor:
@@ -29,10 +91,16 @@ class SchemaExtractor:
             True if connection successful, False otherwise
         """
         try:
+            # Extraction only reads INFORMATION_SCHEMA, so autocommit skips
+            # transaction setup; the check below verifies connectivity once
+            # rather than pinging on every checkout.
             self.engine = create_engine(
                 self.config.get_connection_string(),
-                pool_pre_ping=True,
-                pool_recycle=3600
+                pool_size=8,
+                max_overflow=4,
+                pool_pre_ping=False,
+                pool_recycle=1800,
+                isolation_level="AUTOCOMMIT"
             )
             
             # Test connection
@@ -51,10 +119,22 @@ class SchemaExtractor:
             self.engine.dispose()
             self.engine = None
     
-    def extract_columns(self, table_name: str) -> List[ColumnModel]:
-        """Extract column information for a table."""
+    def _iter_rows(self, query) -> Iterator[Row]:
+        """
+        Stream rows of a schema-wide query through a server-side cursor.
+        
+        Keeps memory bounded to one chunk of rows instead of the whole
+        result set on databases with many tables.
+        """
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(yield_per=STREAM_CHUNK_SIZE)
+            yield from conn.execute(query, {"schema": self.config.name})
+    
+    def extract_all_columns(self) -> Dict[str, List[ColumnDict]]:
+        """Extract column information for every table, keyed by table name."""
         query = text("""
             SELECT 
+                TABLE_NAME,
                 COLUMN_NAME,
                 DATA_TYPE,
                 IS_NULLABLE,
@@ -67,66 +147,64 @@ class SchemaExtractor:
                 COLUMN_COMMENT
             FROM INFORMATION_SCHEMA.COLUMNS
             WHERE TABLE_SCHEMA = :schema
-            AND TABLE_NAME = :table_name
-            ORDER BY ORDINAL_POSITION
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
         """)
         
-        columns = []
-        with self.engine.connect() as conn:
-            result = conn.execute(query, {"schema": self.config.name, "table_name": table_name})
-            for row in result:
-                column = ColumnModel(
-                    name=row[0],
-                    data_type=row[1],
-                    is_nullable=(row[2] == 'YES'),
-                    default_value=row[3],
-                    character_maximum_length=row[4],
-                    numeric_precision=row[5],
-                    numeric_scale=row[6],
-                    column_key=row[7] if row[7] else None,
-                    extra=row[8] if row[8] else None,
-                    column_comment=row[9] if row[9] else None
-                )
-                columns.append(column)
+        columns = defaultdict(list)
+        for row in self._iter_rows(query):
+            column: ColumnDict = {
+                "name": row[1],
+                "data_type": _intern(row[2]),
+                "is_nullable": row[3] == 'YES',
+                "default_value": row[4],
+                "character_maximum_length": row[5],
+                "numeric_precision": row[6],
+                "numeric_scale": row[7],
+                "column_key": _intern(row[8]) if row[8] else None,
+                "extra": _intern(row[9]) if row[9] else None,
+                "column_comment": row[10] if row[10] else None
+            }
+            columns[row[0]].append(column)
         
         return columns
     
-    def extract_indexes(self, table_name: str) -> List[IndexModel]:
-        """Extract index information for a table."""
+    def extract_all_indexes(self) -> Dict[str, List[IndexDict]]:
+        """Extract index information for every table, keyed by table name."""
         query = text("""
             SELECT 
+                TABLE_NAME,
                 INDEX_NAME,
-                GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX SEPARATOR ',') as COLUMNS,
-                MAX(NON_UNIQUE) as NON_UNIQUE,
+                COLUMN_NAME,
+                NON_UNIQUE,
                 INDEX_TYPE
             FROM INFORMATION_SCHEMA.STATISTICS
             WHERE TABLE_SCHEMA = :schema
-            AND TABLE_NAME = :table_name
-            GROUP BY INDEX_NAME, INDEX_TYPE
+            AND INDEX_NAME <> 'PRIMARY'
+            ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
         """)
         
-        indexes = []
-        with self.engine.connect() as conn:
-            result = conn.execute(query, {"schema": self.config.name, "table_name": table_name})
-            for row in result:
-                # Skip primary key (it's handled separately)
-                if row[0] == 'PRIMARY':
-                    continue
-                
-                index = IndexModel(
-                    name=row[0],
-                    column_names=row[1].split(','),
-                    is_unique=(row[2] == 0),
-                    index_type=row[3]
-                )
-                indexes.append(index)
+        # Rows arrive one per indexed column, so group them client-side
+        # rather than relying on GROUP_CONCAT (truncated at group_concat_max_len)
+        indexes = defaultdict(list)
+        rows_by_index = groupby(self._iter_rows(query), key=lambda r: (r[0], r[1]))
+        for (table_name, index_name), group in rows_by_index:
+            rows = list(group)
+            
+            index: IndexDict = {
+                "name": index_name,
+                "column_names": [row[2] for row in rows],
+                "is_unique": all(row[3] == 0 for row in rows),
+                "index_type": _intern(rows[0][4])
+            }
+            indexes[table_name].append(index)
         
         return indexes
     
-    def extract_foreign_keys(self, table_name: str) -> List[ForeignKeyModel]:
-        """Extract foreign key information for a table."""
+    def extract_all_foreign_keys(self) -> Dict[str, List[ForeignKeyDict]]:
+        """Extract foreign key information for every table, keyed by table name."""
         query = text("""
             SELECT 
+                kcu.TABLE_NAME,
                 kcu.CONSTRAINT_NAME,
                 kcu.COLUMN_NAME,
                 kcu.REFERENCED_TABLE_SCHEMA,
@@ -139,44 +217,38 @@ class SchemaExtractor:
                 ON kcu.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
                 AND kcu.TABLE_SCHEMA = rc.CONSTRAINT_SCHEMA
             WHERE kcu.TABLE_SCHEMA = :schema
-            AND kcu.TABLE_NAME = :table_name
             AND kcu.REFERENCED_TABLE_NAME IS NOT NULL
-            ORDER BY kcu.ORDINAL_POSITION
+            ORDER BY kcu.TABLE_NAME, kcu.ORDINAL_POSITION
         """)
         
-        foreign_keys = []
-        with self.engine.connect() as conn:
-            result = conn.execute(query, {"schema": self.config.name, "table_name": table_name})
-            for row in result:
-                fk = ForeignKeyModel(
-                    constraint_name=row[0],
-                    column_name=row[1],
-                    referenced_table_schema=row[2],
-                    referenced_table_name=row[3],
-                    referenced_column_name=row[4],
-                    update_rule=row[5],
-                    delete_rule=row[6]
-                )
-                foreign_keys.append(fk)
+        foreign_keys = defaultdict(list)
+        for row in self._iter_rows(query):
+            fk: ForeignKeyDict = {
+                "constraint_name": row[1],
+                "column_name": row[2],
+                "referenced_table_schema": row[3],
+                "referenced_table_name": row[4],
+                "referenced_column_name": row[5],
+                "update_rule": _intern(row[6]),
+                "delete_rule": _intern(row[7])
+            }
+            foreign_keys[row[0]].append(fk)
         
         return foreign_keys
     
-    def extract_primary_key_columns(self, table_name: str) -> List[str]:
-        """Extract primary key column names for a table."""
+    def extract_all_primary_key_columns(self) -> Dict[str, List[str]]:
+        """Extract primary key column names for every table, keyed by table name."""
         query = text("""
-            SELECT COLUMN_NAME
+            SELECT TABLE_NAME, COLUMN_NAME
             FROM INFORMATION_SCHEMA.STATISTICS
             WHERE TABLE_SCHEMA = :schema
-            AND TABLE_NAME = :table_name
             AND INDEX_NAME = 'PRIMARY'
-            ORDER BY SEQ_IN_INDEX
+            ORDER BY TABLE_NAME, SEQ_IN_INDEX
         """)
         
-        pk_columns = []
-        with self.engine.connect() as conn:
-            result = conn.execute(query, {"schema": self.config.name, "table_name": table_name})
-            for row in result:
-                pk_columns.append(row[0])
+        pk_columns = defaultdict(list)
+        for row in self._iter_rows(query):
+            pk_columns[row[0]].append(row[1])
         
         return pk_columns
     
@@ -196,34 +268,39 @@ class SchemaExtractor:
             ORDER BY TABLE_NAME
         """)
         
-        tables = []
-        with self.engine.connect() as conn:
-            result = conn.execute(query, {"schema": self.config.name})
-            for row in result:
-                table_name = row[0]
-                
-                # Extract detailed information for this table
-                columns = self.extract_columns(table_name)
-                indexes = self.extract_indexes(table_name)
-                foreign_keys = self.extract_foreign_keys(table_name)
-                primary_key_columns = self.extract_primary_key_columns(table_name)
-                
-                table = TableModel(
-                    name=table_name,
-                    table_type=row[1],
-                    engine=row[2],
-                    row_count=row[3],
-                    data_length=row[4],
-                    index_length=row[5],
-                    table_comment=row[6] if row[6] else None,
-                    columns=columns,
-                    indexes=indexes,
-                    foreign_keys=foreign_keys,
-                    primary_key_columns=primary_key_columns
-                )
-                tables.append(table)
+        # Fetch metadata for the whole schema with one query per kind instead
+        # of four queries per table; the queries are independent, so run
+        # them concurrently on pooled connections.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            columns_future = executor.submit(self.extract_all_columns)
+            indexes_future = executor.submit(self.extract_all_indexes)
+            foreign_keys_future = executor.submit(self.extract_all_foreign_keys)
+            primary_keys_future = executor.submit(self.extract_all_primary_key_columns)
+            
+            columns = columns_future.result()
+            indexes = indexes_future.result()
+            foreign_keys = foreign_keys_future.result()
+            primary_key_columns = primary_keys_future.result()
+        
+        tables: List[Dict[str, Any]] = []
+        for row in self._iter_rows(query):
+            table_name = row[0]
+            
+            tables.append({
+                "name": table_name,
+                "table_type": _intern(row[1]),
+                "engine": _intern(row[2]),
+                "row_count": row[3],
+                "data_length": row[4],
+                "index_length": row[5],
+                "table_comment": row[6] if row[6] else None,
+                "columns": columns.get(table_name, []),
+                "indexes": indexes.get(table_name, []),
+                "foreign_keys": foreign_keys.get(table_name, []),
+                "primary_key_columns": primary_key_columns.get(table_name, [])
+            })
         
-        return tables
+        return _TABLES_ADAPTER.validate_python(tables)
     
     def extract_database_info(self) -> DatabaseModel:
         """Extract complete database schema information."""
@@ -247,7 +324,7 @@ class SchemaExtractor:
         # Extract all tables
         tables = self.extract_tables()
         
-        database = DatabaseModel(
+        database = DatabaseModel.model_construct(
             name=self.config.name,
             host=self.config.host,
             port=self.config.port,
@@ -266,49 +343,76 @@ class OntologyExtractor:
         """Initialize with list of database configurations."""
         self.database_configs = database_configs
     
-    def extract_ontology(self) -> OntologyModel:
+    def extract_ontology(
+        self,
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> OntologyModel:
         """
         Extract complete ontology from all configured databases.
         
+        Args:
+            progress_callback: Called with the number of databases processed
+                so far each time one finishes (successfully or not)
+        
         Returns:
             OntologyModel containing all databases and relationships
         """
-        ontology = OntologyModel(
+        ontology = OntologyModel.model_construct(
             metadata={
                 "extraction_date": datetime.now().isoformat(),
                 "database_count": len(self.database_configs)
             }
         )
         
-        # Extract schema from each database
-        for config in self.database_configs:
-            print(f"Extracting schema from {config.get_display_name()}...")
-            
-            extractor = SchemaExtractor(config)
-            if not extractor.connect():
-                print(f"Skipping {config.get_display_name()} due to connection failure")
-                continue
+        # Databases share no state, so extract them concurrently, capped to
+        # keep the total connection count within typical server limits
+        max_workers = max(1, min(len(self.database_configs), DATABASE_WORKERS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._extract_single, config)
+                for config in self.database_configs
+            ]
             
-            try:
-                database = extractor.extract_database_info()
+            for completed, _ in enumerate(as_completed(futures), start=1):
+                if progress_callback:
+                    progress_callback(completed)
+        
+        # Collect results in configuration order
+        for future in futures:
+            database = future.result()
+            if database is not None:
                 ontology.databases.append(database)
-                print(f"  ✓ Extracted {len(database.tables)} tables")
-            except Exception as e:
-                print(f"Error extracting schema from {config.get_display_name()}: {e}")
-            finally:
-                extractor.disconnect()
         
         # Build relationships from foreign keys
         self._build_relationships(ontology)
         
         return ontology
     
+    def _extract_single(self, config: DatabaseConfig) -> Optional[DatabaseModel]:
+        """Extract schema from one database, or None if it cannot be read."""
+        print(f"Extracting schema from {config.get_display_name()}...")
+        
+        extractor = SchemaExtractor(config)
+        if not extractor.connect():
+            print(f"Skipping {config.get_display_name()} due to connection failure")
+            return None
+        
+        try:
+            database = extractor.extract_database_info()
+            print(f"  ✓ Extracted {len(database.tables)} tables from {config.get_display_name()}")
+            return database
+        except Exception as e:
+            print(f"Error extracting schema from {config.get_display_name()}: {e}")
+            return None
+        finally:
+            extractor.disconnect()
+    
     def _build_relationships(self, ontology: OntologyModel):
         """Build relationship list from foreign keys."""
         for database in ontology.databases:
             for table in database.tables:
                 for fk in table.foreign_keys:
-                    relationship = RelationshipModel(
+                    relationship = RelationshipModel.model_construct(
                         source_database=database.name,
                         source_table=table.name,
                         source_column=fk.column_name,
@@ -1,17 +1,21 @@
 """Main CLI entry point for database ontology mapper."""
 
-import json
 import click
+import orjson
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import List, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress
 
-from .config import load_database_configs, get_app_config
-from .extractor import OntologyExtractor
+from .config import DatabaseConfig, load_database_configs, get_app_config
 
 console = Console()
 
+# Server-internal schemas hidden from list-databases output
+_SYSTEM_DBS = frozenset({'information_schema', 'mysql', 'performance_schema', 'sys'})
+
 
 @click.group()
 def cli():
@@ -23,6 +27,10 @@ def cli():
 @click.option('--output', '-o', default=None, help='Output directory for ontology data')
 def extract(output):
     """Extract schema information from configured databases."""
+    # Imported here so other commands (and --help) skip SQLAlchemy/pymysql
+    from rich.progress import Progress
+    from .extractor import OntologyExtractor
+    
     console.print("[bold blue]Database Ontology Mapper[/bold blue]")
     console.print("=" * 60)
     
@@ -61,17 +69,26 @@ def extract(output):
         task = progress.add_task("[cyan]Extracting schemas...", total=len(db_configs))
         
         extractor = OntologyExtractor(db_configs)
-        ontology = extractor.extract_ontology()
-        
-        progress.update(task, completed=len(db_configs))
+        ontology = extractor.extract_ontology(
+            progress_callback=lambda done: progress.update(task, completed=done)
+        )
     
     # Save to file
     output_dir = Path(output) if output else Path(app_config.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    # Stream to a temporary file, then swap it in so the API never reloads
+    # a half-written ontology
     output_file = output_dir / "ontology.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(ontology.to_dict(), f, indent=2, default=str)
+    temp_file = output_file.with_name(output_file.name + ".tmp")
+    try:
+        with open(temp_file, 'wb') as f:
+            ontology.write_json(f)
+    except BaseException:
+        # Don't leave a partial file behind when the write fails or is interrupted
+        temp_file.unlink(missing_ok=True)
+        raise
+    temp_file.replace(output_file)
     
     console.print(f"\n[green]✓ Ontology saved to {output_file}[/green]")
     
@@ -80,16 +97,9 @@ def extract(output):
     stats_table.add_column("Metric", style="cyan")
     stats_table.add_column("Count", style="green", justify="right")
     
-    total_tables = sum(len(db.tables) for db in ontology.databases)
-    total_columns = sum(
-        len(table.columns) 
-        for db in ontology.databases 
-        for table in db.tables
-    )
-    
     stats_table.add_row("Databases", str(len(ontology.databases)))
-    stats_table.add_row("Tables", str(total_tables))
-    stats_table.add_row("Columns", str(total_columns))
+    stats_table.add_row("Tables", str(ontology.total_tables))
+    stats_table.add_row("Columns", str(ontology.total_columns))
     stats_table.add_row("Relationships", str(len(ontology.relationships)))
     
     console.print()
@@ -100,7 +110,9 @@ def extract(output):
 @click.option('--host', '-h', default='0.0.0.0', help='API host')
 @click.option('--port', '-p', default=8000, help='API port')
 @click.option('--reload', is_flag=True, help='Enable auto-reload')
-def serve(host, port, reload):
+@click.option('--workers', '-w', default=1, envvar='WEB_CONCURRENCY', show_default=True,
+              help='Number of worker processes (ignored with --reload)')
+def serve(host, port, reload, workers):
     """Start the web server for visualization."""
     import uvicorn
     
@@ -114,15 +126,57 @@ def serve(host, port, reload):
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
         log_level="info"
     )
 
 
+def _probe_host(configs: List[DatabaseConfig]) -> Tuple[Optional[List[str]], List[str]]:
+    """
+    List databases on one server, trying each distinct set of credentials.
+    
+    Returns:
+        Sorted non-system database names (None if no credentials worked)
+        and the messages describing each connection attempt
+    """
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.pool import NullPool
+    
+    messages = []
+    tried_credentials = set()
+    for config in configs:
+        credentials = (config.user, config.password)
+        if credentials in tried_credentials:
+            continue
+        tried_credentials.add(credentials)
+        
+        try:
+            messages.append(f"Attempting connection with user: {config.user}")
+            
+            # Connect to server (to 'information_schema' which always exists);
+            # one-shot query, so skip pooling and the pre-ping round trip
+            engine = create_engine(
+                config.get_connection_string(database='information_schema'),
+                poolclass=NullPool
+            )
+            
+            with engine.connect() as conn:
+                result = conn.execute(text("SHOW DATABASES"))
+                # Skip system databases while sorting in a single pass
+                databases = sorted(row[0] for row in result if row[0] not in _SYSTEM_DBS)
+            
+            engine.dispose()
+            return databases, messages  # Success, no need to try other configs
+            
+        except Exception as e:
+            messages.append(f"[yellow]Failed with user {config.user}: {e}[/yellow]")
+    
+    return None, messages
+
+
 @cli.command()
 def list_databases():
     """List all available databases on configured servers."""
-    from sqlalchemy import create_engine, text
-    
     console.print("[bold blue]Available Databases on Configured Servers[/bold blue]")
     console.print("=" * 60)
     console.print()
@@ -134,65 +188,50 @@ def list_databases():
         return
     
     # Group by host
-    hosts = {}
+    hosts = defaultdict(list)
     for config in db_configs:
-        host_key = f"{config.host}:{config.port}"
-        if host_key not in hosts:
-            hosts[host_key] = []
-        hosts[host_key].append(config)
-    
-    for host_key, configs in hosts.items():
-        console.print(f"[cyan]Server: {host_key}[/cyan]")
+        hosts[f"{config.host}:{config.port}"].append(config)
+    
+    # Probing is dominated by connection latency, so query all servers
+    # concurrently and report each one as soon as it answers
+    with ThreadPoolExecutor(max_workers=min(32, len(hosts))) as executor:
+        futures = {
+            executor.submit(_probe_host, configs): host_key
+            for host_key, configs in hosts.items()
+        }
         
-        # Try each config until one works
-        connected = False
-        for config in configs:
-            try:
-                console.print(f"Attempting connection with user: {config.user}")
-                
-                # Connect to server (to 'information_schema' which always exists)
-                temp_config = config.model_copy()
-                temp_config.name = 'information_schema'
-                engine = create_engine(temp_config.get_connection_string(), pool_pre_ping=True)
-                
-                with engine.connect() as conn:
-                    result = conn.execute(text("SHOW DATABASES"))
-                    databases = [row[0] for row in result]
-                
-                engine.dispose()
-                
-                # Display in a table
-                table = Table(title=f"Databases on {host_key}")
-                table.add_column("Database Name", style="green")
-                table.add_column("In Config?", style="yellow")
-                
-                configured_names = {c.name for c in configs}
-                
-                for db_name in sorted(databases):
-                    # Skip system databases
-                    if db_name in ['information_schema', 'mysql', 'performance_schema', 'sys']:
-                        continue
-                    
-                    in_config = "✓" if db_name in configured_names else ""
-                    table.add_row(db_name, in_config)
-                
-                console.print(table)
+        for future in as_completed(futures):
+            host_key = futures[future]
+            databases, messages = future.result()
+            
+            console.print(f"[cyan]Server: {host_key}[/cyan]")
+            for message in messages:
+                console.print(message)
+            
+            if databases is None:
+                console.print(f"[red]Could not connect to {host_key} with any configured credentials[/red]")
                 console.print()
-                connected = True
-                break  # Success, no need to try other configs
-                
-            except Exception as e:
-                console.print(f"[yellow]Failed with user {config.user}: {e}[/yellow]")
                 continue
-        
-        if not connected:
-            console.print(f"[red]Could not connect to {host_key} with any configured credentials[/red]")
+            
+            # Display in a table
+            table = Table(title=f"Databases on {host_key}")
+            table.add_column("Database Name", style="green")
+            table.add_column("In Config?", style="yellow")
+            
+            configured_names = {c.name for c in hosts[host_key]}
+            
+            for db_name in databases:
+                in_config = "✓" if db_name in configured_names else ""
+                table.add_row(db_name, in_config)
+            
+            console.print(table)
             console.print()
 
 
 @cli.command()
 @click.option('--input', '-i', default=None, help='Input ontology JSON file')
-def stats(input):
+@click.option('--full', is_flag=True, help='Validate the whole file against the ontology models')
+def stats(input, full):
     """Display ontology statistics."""
     app_config = get_app_config()
     
@@ -203,11 +242,25 @@ def stats(input):
         console.print("Please run 'extract' command first.")
         return
     
-    # Load ontology
-    with open(input_file, 'r', encoding='utf-8') as f:
+    # Load ontology as (name, host, table count, column count) per database
+    data = input_file.read_bytes()
+    if full:
         from .models import OntologyModel
-        data = json.load(f)
-        ontology = OntologyModel(**data)
+        ontology = OntologyModel.model_validate_json(data)
+        db_rows = [
+            (db.name, db.host, db.table_count, db.column_count)
+            for db in ontology.databases
+        ]
+        relationship_count = len(ontology.relationships)
+    else:
+        # Counts only need array lengths, so skip building models entirely
+        raw = orjson.loads(data)
+        db_rows = []
+        for db in raw.get("databases", []):
+            tables = db.get("tables", [])
+            column_count = sum(len(table.get("columns", [])) for table in tables)
+            db_rows.append((db["name"], db["host"], len(tables), column_count))
+        relationship_count = len(raw.get("relationships", []))
     
     console.print("[bold blue]Ontology Statistics[/bold blue]")
     console.print("=" * 60)
@@ -218,17 +271,10 @@ def stats(input):
     stats_table.add_column("Metric", style="cyan")
     stats_table.add_column("Value", style="green", justify="right")
     
-    total_tables = sum(len(db.tables) for db in ontology.databases)
-    total_columns = sum(
-        len(table.columns) 
-        for db in ontology.databases 
-        for table in db.tables
-    )
-    
-    stats_table.add_row("Databases", str(len(ontology.databases)))
-    stats_table.add_row("Tables", str(total_tables))
-    stats_table.add_row("Columns", str(total_columns))
-    stats_table.add_row("Relationships", str(len(ontology.relationships)))
+    stats_table.add_row("Databases", str(len(db_rows)))
+    stats_table.add_row("Tables", str(sum(row[2] for row in db_rows)))
+    stats_table.add_row("Columns", str(sum(row[3] for row in db_rows)))
+    stats_table.add_row("Relationships", str(relationship_count))
     
     console.print(stats_table)
     console.print()
@@ -240,12 +286,11 @@ def stats(input):
     db_table.add_column("Tables", style="green", justify="right")
     db_table.add_column("Columns", style="yellow", justify="right")
     
-    for db in ontology.databases:
-        column_count = sum(len(table.columns) for table in db.tables)
+    for name, host, table_count, column_count in db_rows:
         db_table.add_row(
-            db.name,
-            db.host,
-            str(len(db.tables)),
+            name,
+            host,
+            str(table_count),
             str(column_count)
         )
     
@@ -1,7 +1,9 @@
 """Data models for database ontology."""
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import BinaryIO, List, Optional, Dict, Any
+
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ColumnModel(BaseModel):
@@ -65,6 +67,33 @@ class DatabaseModel(BaseModel):
     tables: List[TableModel] = Field(default_factory=list)
     character_set: Optional[str] = None
     collation: Optional[str] = None
+    
+    # Lookup index built on first use; tables are not modified after loading.
+    # Kept out of equality by __eq__ so lookups do not change comparisons.
+    _table_index: Optional[Dict[str, TableModel]] = PrivateAttr(default=None)
+    
+    def __eq__(self, other: Any) -> bool:
+        """Compare field values only, ignoring the lookup index."""
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+    
+    @property
+    def table_count(self) -> int:
+        """Number of tables in this database."""
+        return len(self.tables)
+    
+    @property
+    def column_count(self) -> int:
+        """Number of columns across all tables."""
+        return sum(len(table.columns) for table in self.tables)
+    
+    def get_table(self, name: str) -> Optional[TableModel]:
+        """Get table by name."""
+        if self._table_index is None:
+            # Reversed so the first table with a given name wins, as in a scan
+            self._table_index = {table.name: table for table in reversed(self.tables)}
+        return self._table_index.get(name)
 
 
 class RelationshipModel(BaseModel):
@@ -87,23 +116,69 @@ class OntologyModel(BaseModel):
     relationships: List[RelationshipModel] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
+    # Lookup index built on first use; databases are not modified after loading.
+    # Kept out of equality by __eq__ so lookups do not change comparisons.
+    _database_index: Optional[Dict[str, DatabaseModel]] = PrivateAttr(default=None)
+    
+    def __eq__(self, other: Any) -> bool:
+        """Compare field values only, ignoring the lookup index."""
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+    
+    @property
+    def total_tables(self) -> int:
+        """Number of tables across all databases."""
+        return sum(db.table_count for db in self.databases)
+    
+    @property
+    def total_columns(self) -> int:
+        """Number of columns across all databases."""
+        return sum(db.column_count for db in self.databases)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return self.model_dump()
     
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes without building an intermediate dict."""
+        return self.model_dump_json().encode()
+    
+    def write_json(self, fp: BinaryIO):
+        """
+        Stream the ontology as JSON to a binary file, one database at a time.
+        
+        Only a single database is encoded in memory at once, instead of the
+        whole document. None-valued fields are omitted; they are restored
+        from the model defaults when the file is loaded.
+        """
+        fp.write(b'{"databases":[')
+        for i, db in enumerate(self.databases):
+            if i:
+                fp.write(b',')
+            fp.write(db.model_dump_json(exclude_none=True).encode())
+        
+        fp.write(b'],"relationships":[')
+        for i, rel in enumerate(self.relationships):
+            if i:
+                fp.write(b',')
+            fp.write(rel.model_dump_json(exclude_none=True).encode())
+        
+        fp.write(b'],"metadata":')
+        fp.write(orjson.dumps(self.metadata, default=str))
+        fp.write(b'}')
+    
     def get_database(self, name: str) -> Optional[DatabaseModel]:
         """Get database by name."""
-        for db in self.databases:
-            if db.name == name:
-                return db
-        return None
+        if self._database_index is None:
+            # Reversed so the first database with a given name wins, as in a scan
+            self._database_index = {db.name: db for db in reversed(self.databases)}
+        return self._database_index.get(name)
     
     def get_table(self, database_name: str, table_name: str) -> Optional[TableModel]:
         """Get table by database and table name."""
         db = self.get_database(database_name)
         if db:
-            for table in db.tables:
-                if table.name == table_name:
-                    return table
+            return db.get_table(table_name)
         return None
 